@@ -15,7 +15,6 @@ from dotenv import load_dotenv
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from agents.adk_orchestrator_agent import ADKOrchestratorAgent
 from core.session_manager import SessionManager
 
 # Load environment variables
@@ -43,6 +42,10 @@ class ShortFactoryRunner:
         if not api_key:
             raise ValueError("Google API key is required. Set GEMINI_API_KEY or GOOGLE_API_KEY environment variable.")
         
+        # Imported here so --help, a missing topic or a missing key exit
+        # without loading the agents package (google-adk, genai, PIL)
+        from agents.adk_orchestrator_agent import ADKOrchestratorAgent
+        
         # Initialize session manager and ADK orchestrator
         self.session_manager = SessionManager()
         self.orchestrator = ADKOrchestratorAgent(self.session_manager)
@@ -172,15 +175,17 @@ async def main_shortfactory(topic: Optional[str] = None,
         
         # Print build report summary
         build_report = results['build_report']
-        logger.info("\n📊 Build Report Summary:")
-        for stage, info in build_report.get('stages', {}).items():
-            status_icon = "✅" if info['status'] == 'success' else "❌"
-            logger.info(f"  {status_icon} {stage}: {info['time_ms']}ms")
+        summary_lines = ["\n📊 Build Report Summary:"]
+        summary_lines.extend(
+            f"  {'✅' if info['status'] == 'success' else '❌'} {stage}: {info['time_ms']}ms"
+            for stage, info in build_report.get('stages', {}).items()
+        )
+        logger.info("\n".join(summary_lines))
         
         if build_report.get('errors'):
-            logger.warning(f"\n⚠️ {len(build_report['errors'])} errors occurred:")
-            for error in build_report['errors']:
-                logger.warning(f"  - {error['stage']}: {error['error']}")
+            error_lines = [f"\n⚠️ {len(build_report['errors'])} errors occurred:"]
+            error_lines.extend(f"  - {error['stage']}: {error['error']}" for error in build_report['errors'])
+            logger.warning("\n".join(error_lines))
         
         return results
         
@@ -216,6 +221,13 @@ Examples:
 
     args = parse_arguments()
     
+    # Use uvloop's libuv-based event loop when it is installed (optional, not on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     # Handle test mode
     if args.test:
         test_topic = "Why are dachshunds so short?"
@@ -10,8 +10,8 @@ echo "1️⃣ Python 버전 확인..."
 python_version=$(python3 --version 2>&1 | awk '{print $2}')
 echo "   Python 버전: $python_version"
 
-if ! python3 -c "import sys; exit(0 if sys.version_info >= (3, 8) else 1)"; then
-    echo "❌ Python 3.8 이상이 필요합니다. 현재 버전: $python_version"
+if ! python3 -c "import sys; exit(0 if sys.version_info >= (3, 9) else 1)"; then
+    echo "❌ Python 3.9 이상이 필요합니다. 현재 버전: $python_version"
     exit 1
 fi
 
@@ -3,6 +3,7 @@ ADK-based Orchestrator Agent
 Implements proper ADK patterns and manages the complete video production pipeline
 """
 
+import asyncio
 import json
 import logging
 import time
@@ -59,7 +60,7 @@ class ADKOrchestratorAgent:
         """
         
         # Create session
-        session_id = self.session_manager.create_session(topic)
+        session_id = await asyncio.to_thread(self.session_manager.create_session, topic)
         logger.info(f"🎬 Starting ADK video production pipeline - Session: {session_id}")
         
         # Initialize build report
@@ -104,8 +105,7 @@ class ADKOrchestratorAgent:
             
             # Save full script
             script_file = self.session_manager.get_session_dir(session_id) / "full_script.json"
-            with open(script_file, 'w', encoding='utf-8') as f:
-                json.dump(full_script_output.model_dump(), f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(self._write_json, script_file, full_script_output.model_dump())
             
             # Stage 2: Scene Script Generation
             logger.info("🎭 Stage 2: Generating detailed scene scripts with ADK...")
@@ -113,7 +113,8 @@ class ADKOrchestratorAgent:
             
             scenes = full_script_output.scenes
             scene_packages = []
-            previous_scenes = []
+            scene_package_dicts = []  # Each package dumped once: continuity input for later scenes and the final package
+            pending_writes = []  # (scene_number, write future) pairs running behind the next LLM call
             
             # Prepare global context
             global_context = {
@@ -134,23 +135,22 @@ class ADKOrchestratorAgent:
                     scene_input = SceneExpansionInput(
                         scene_data=scene_data.model_dump() if hasattr(scene_data, 'model_dump') else scene_data,
                         global_context=global_context,
-                        previous_scenes=[
-                            pkg.model_dump() if hasattr(pkg, 'model_dump') else pkg 
-                            for pkg in previous_scenes
-                        ]
+                        previous_scenes=scene_package_dicts
                     )
                     
                     scene_package = await self.scene_script_agent.expand_scene(scene_input)
+                    scene_package_dict = scene_package.model_dump()
                     
                     scene_packages.append(scene_package)
-                    previous_scenes.append(scene_package)
+                    scene_package_dicts.append(scene_package_dict)
                     
-                    # Save individual scene package
+                    # Save individual scene package (off the event loop, joined after the loop)
                     scene_file = self.session_manager.get_session_dir(session_id) / f"scene_package_{scene_number}.json"
-                    with open(scene_file, 'w', encoding='utf-8') as f:
-                        json.dump(scene_package.model_dump(), f, indent=2, ensure_ascii=False)
+                    pending_writes.append((scene_number, asyncio.ensure_future(
+                        asyncio.to_thread(self._write_json, scene_file, scene_package_dict)
+                    )))
                     
-                    logger.info(f"✅ Scene {scene_number} generated and saved")
+                    logger.info(f"✅ Scene {scene_number} generated")
                     
                 except Exception as e:
                     logger.error(f"❌ Failed to generate scene {scene_number}: {e}")
@@ -162,6 +162,19 @@ class ADKOrchestratorAgent:
                     # Continue with other scenes
                     continue
             
+            # Wait for the scene files before anything reads the session directory
+            write_results = await asyncio.gather(
+                *(write for _, write in pending_writes), return_exceptions=True
+            )
+            for (scene_number, _), write_result in zip(pending_writes, write_results):
+                if isinstance(write_result, Exception):
+                    logger.error(f"❌ Failed to save scene package {scene_number}: {write_result}")
+                    build_report.setdefault("errors", []).append({
+                        "stage": "scene_scripts",
+                        "scene": scene_number,
+                        "error": str(write_result)
+                    })
+            
             stage_time = time.time() - stage_start
             build_report["stages"]["scene_scripts"] = {
                 "status": "success",
@@ -200,15 +213,14 @@ class ADKOrchestratorAgent:
                     "pipeline_version": "adk_2.0"
                 },
                 "full_script": full_script_output.model_dump(),
-                "scene_packages": [pkg.model_dump() for pkg in scene_packages],
+                "scene_packages": scene_package_dicts,
                 "validation_results": validation_results,
                 "build_report": build_report
             }
             
             # Save complete package
             package_file = self.session_manager.get_session_dir(session_id) / "production_package.json"
-            with open(package_file, 'w', encoding='utf-8') as f:
-                json.dump(production_package, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(self._write_json, package_file, production_package)
             
             # Update build report
             build_report["success"] = True
@@ -223,8 +235,7 @@ class ADKOrchestratorAgent:
             
             # Save final build report
             report_file = self.session_manager.get_session_dir(session_id) / "build_report.json"
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(build_report, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(self._write_json, report_file, build_report)
             
             logger.info(f"🎉 ADK video production pipeline completed successfully!")
             logger.info(f"📊 Success Rate: {build_report['performance_metrics']['overall_success_rate']:.1%}")
@@ -238,11 +249,16 @@ class ADKOrchestratorAgent:
             
             # Save error report
             report_file = self.session_manager.get_session_dir(session_id) / "build_report.json"
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(build_report, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(self._write_json, report_file, build_report)
             
             raise
     
+    @staticmethod
+    def _write_json(path: Path, data: Any):
+        """Write data to path as indented UTF-8 JSON (safe to run in a worker thread)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    
     def _validate_production_package(self, 
                                    full_script_output: FullScriptOutput, 
                                    scene_packages: List[ScenePackageOutput]) -> Dict[str, Any]:
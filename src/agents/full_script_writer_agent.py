@@ -10,6 +10,7 @@ from google.adk.sessions import InMemorySessionService
 from google.genai import types
 from model.input_models import FullScriptInput
 from model.simple_models import SimpleFullScript
+from model.schema_registry import get_model_schema
 
 logger = logging.getLogger(__name__)
 
@@ -78,8 +79,8 @@ Include title, overall_style, story_summary, and scenes array with rich, detaile
         )
         
         # Legacy compatibility for tests
-        self.input_schema = FullScriptInput.model_json_schema()
-        self.output_schema = SimpleFullScript.model_json_schema()
+        self.input_schema = get_model_schema(FullScriptInput)
+        self.output_schema = get_model_schema(SimpleFullScript)
         self.output_key = "full_script_result"
         
         logger.info("🚀 ADK Full Script Writer Agent initialized with structured output")
@@ -7,6 +7,7 @@ import os
 import json
 import logging
 import time
+import asyncio
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import google.genai as genai
@@ -17,6 +18,29 @@ from io import BytesIO
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Terms stripped from prompts, one pass per term in this order so a term hidden
+# inside another (e.g. 'vionsfwlent') is exposed and removed by a later pass
+_BLOCKED_TERMS = ('nsfw', 'explicit', 'violent', 'harmful')
+
+# Gemini image requests allowed in flight at once (frames and scenes run concurrently)
+_MAX_CONCURRENT_IMAGE_REQUESTS = 4
+
+# Exclusions appended to every negative prompt
+_BASE_NEGATIVES = ', '.join([
+    "low quality", "blurry", "distorted", "watermark",
+    "text artifacts", "extra limbs", "malformed"
+])
+
+# Aspect ratio -> (width, height) in pixels
+_RATIO_DIMENSIONS = {
+    '16:9': (1024, 576),
+    '9:16': (576, 1024),
+    '1:1': (1024, 1024),
+    '4:5': (819, 1024),
+    '3:2': (1024, 683),
+    '2:3': (683, 1024)
+}
+
 class ImageCreateAgent:
     """
     Image Create Agent - New Architecture
@@ -39,6 +63,9 @@ class ImageCreateAgent:
         self.glowbie_character_path = Path("src/assets/glowbie.png")
         self.glowbie_character_data = self._load_glowbie_character()
         
+        # Created on first use so it binds to the running event loop
+        self._image_request_slots: Optional[asyncio.Semaphore] = None
+        
         logger.info("Image Create Agent initialized with new architecture")
     
     def _load_glowbie_character(self) -> Optional[bytes]:
@@ -99,24 +126,27 @@ class ImageCreateAgent:
                 logger.info("💰 Cost-saving mode enabled - using enhanced mock images with Glowbie")
                 return await self._generate_mock_images(visuals, session_id, cosplay_instructions)
             
+            if self._image_request_slots is None:
+                self._image_request_slots = asyncio.Semaphore(_MAX_CONCURRENT_IMAGE_REQUESTS)
+            
+            # Gemini has no multi-prompt image endpoint, so overlap the per-frame requests
+            results = await asyncio.gather(*(
+                self._generate_single_image(visual, session_id, cosplay_instructions)
+                for visual in visuals
+            ), return_exceptions=True)
+            
             image_assets = []
             
-            for visual in visuals:
-                try:
-                    frame_id = visual.get('frame_id', f"{scene_number}A")
-                    
-                    # Generate image asset with Glowbie character
-                    asset = await self._generate_single_image(visual, session_id, cosplay_instructions)
-                    image_assets.append(asset)
-                    
-                    logger.info(f"✅ Generated image for frame {frame_id}")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Failed to generate image for frame {visual.get('frame_id', 'unknown')}: {str(e)}")
+            for visual, asset in zip(visuals, results):
+                if isinstance(asset, Exception):
+                    logger.error(f"❌ Failed to generate image for frame {visual.get('frame_id', 'unknown')}: {str(asset)}")
                     
                     # Create fallback asset
-                    fallback_asset = self._create_fallback_asset(visual, str(e))
-                    image_assets.append(fallback_asset)
+                    asset = self._create_fallback_asset(visual, str(asset))
+                else:
+                    logger.info(f"✅ Generated image for frame {visual.get('frame_id', f'{scene_number}A')}")
+                
+                image_assets.append(asset)
             
             logger.info(f"Image generation completed: {len([a for a in image_assets if a.get('safety_result') == 'safe'])} successful, {len([a for a in image_assets if a.get('safety_result') != 'safe'])} failed")
             
@@ -166,22 +196,22 @@ class ImageCreateAgent:
             # Convert aspect ratio to dimensions
             width, height = self._aspect_ratio_to_dimensions(aspect_ratio)
             
-            start_time = time.time()
-            
             # Use Gemini Imagen for generation (placeholder - actual implementation depends on available models)
             try:
                 # Generate image with Glowbie character reference
-                image_uri = await self._generate_with_gemini_nano_banana(
-                    prompt=sanitized_prompt,
-                    negative_prompt=final_negative,
-                    width=width,
-                    height=height,
-                    seed=seed,
-                    guidance_scale=guidance_scale,
-                    session_id=session_id,
-                    frame_id=frame_id,
-                    cosplay_instructions=cosplay_instructions
-                )
+                async with self._image_request_slots:
+                    start_time = time.time()
+                    image_uri = await self._generate_with_gemini_nano_banana(
+                        prompt=sanitized_prompt,
+                        negative_prompt=final_negative,
+                        width=width,
+                        height=height,
+                        seed=seed,
+                        guidance_scale=guidance_scale,
+                        session_id=session_id,
+                        frame_id=frame_id,
+                        cosplay_instructions=cosplay_instructions
+                    )
                 
                 generation_time = int((time.time() - start_time) * 1000)
                 
@@ -244,7 +274,6 @@ class ImageCreateAgent:
             
             # Fallback: Enhanced mock generation (different from cost-saving mode)
             # Simulate AI generation time (2-5 seconds)
-            import asyncio
             await asyncio.sleep(2.5)
             
             # Use mock images but with different selection logic for "AI" mode
@@ -532,10 +561,8 @@ class ImageCreateAgent:
         """Sanitize prompt for safety and quality"""
         try:
             # Remove potentially problematic content
-            blocked_terms = ['nsfw', 'explicit', 'violent', 'harmful']
-            
             sanitized = prompt.lower()
-            for term in blocked_terms:
+            for term in _BLOCKED_TERMS:
                 sanitized = sanitized.replace(term, '')
             
             # Ensure minimum length
@@ -550,28 +577,14 @@ class ImageCreateAgent:
     
     def _enhance_negative_prompt(self, negative_prompt: str) -> str:
         """Enhance negative prompt with common exclusions"""
-        base_negatives = [
-            "low quality", "blurry", "distorted", "watermark", 
-            "text artifacts", "extra limbs", "malformed"
-        ]
-        
         if negative_prompt:
-            return f"{negative_prompt}, {', '.join(base_negatives)}"
+            return f"{negative_prompt}, {_BASE_NEGATIVES}"
         else:
-            return ', '.join(base_negatives)
+            return _BASE_NEGATIVES
     
     def _aspect_ratio_to_dimensions(self, aspect_ratio: str) -> tuple:
         """Convert aspect ratio string to width/height dimensions"""
-        ratio_map = {
-            '16:9': (1024, 576),
-            '9:16': (576, 1024),
-            '1:1': (1024, 1024),
-            '4:5': (819, 1024),
-            '3:2': (1024, 683),
-            '2:3': (683, 1024)
-        }
-        
-        return ratio_map.get(aspect_ratio, (1024, 576))
+        return _RATIO_DIMENSIONS.get(aspect_ratio, (1024, 576))
     
     async def _generate_with_stability_ai(self, prompt: str, negative_prompt: str,
                                         width: int, height: int, seed: int,
@@ -658,10 +671,6 @@ class ImageCreateAgent:
                                               frame_id: str, cosplay_instructions: str = "") -> str:
         """Generate image using Gemini 2.5 Flash Image with Glowbie character reference"""
         try:
-            import google.genai as genai
-            from PIL import Image
-            from io import BytesIO
-            
             logger.info(f"🍌 Calling Gemini Nano Banana for frame {frame_id} with Glowbie reference")
             
             # Load Glowbie reference image
@@ -670,8 +679,7 @@ class ImageCreateAgent:
                 enhanced_prompt = f"{prompt}. Include Glowbie, a cute blob-like cartoon character. High quality, detailed, professional."
                 
                 # Use Gemini 2.5 Flash Image model (text-only)
-                client = genai.Client()
-                response = client.models.generate_content(
+                response = await self.client.aio.models.generate_content(
                     model="gemini-2.5-flash-image-preview",
                     contents=[enhanced_prompt],
                     config={
@@ -695,8 +703,7 @@ class ImageCreateAgent:
                 glowbie_image = Image.open(BytesIO(self.glowbie_character_data))
                 
                 # Use Gemini 2.5 Flash Image model with reference image
-                client = genai.Client()
-                response = client.models.generate_content(
+                response = await self.client.aio.models.generate_content(
                     model="gemini-2.5-flash-image-preview",
                     contents=[
                         glowbie_image,  # Reference image
@@ -7,7 +7,8 @@ import os
 import json
 import logging
 import time
-from typing import Dict, Any, List, Optional
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import jsonschema
 from core.session_manager import SessionManager
@@ -236,37 +237,43 @@ class OrchestratorAgent:
             
             all_image_assets = []
             
-            for scene_package in scene_packages:
-                try:
-                    scene_number = scene_package.get("scene_number", 1)
-                    logger.info(f"Generating images for scene {scene_number}...")
-                    
-                    # Get cosplay instructions from full script
-                    cosplay_instructions = full_script.get("cosplay_instructions", "")
-                    
-                    image_assets = await self.image_create_agent.generate_images_for_scene(
-                        scene_package=scene_package,
-                        session_id=session_id,
-                        cost_saving_mode=cost_saving_mode,
-                        cosplay_instructions=cosplay_instructions
-                    )
-                    
-                    # Validate image assets (warning only)
-                    for asset in image_assets:
-                        if not self._validate_against_schema(asset, "ImageAsset"):
-                            logger.warning(f"Image asset {asset.get('frame_id', 'unknown')} failed schema validation, proceeding anyway")
-                    
-                    all_image_assets.extend(image_assets)
-                    
-                    logger.info(f"✅ Generated {len(image_assets)} images for scene {scene_number}")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Failed to generate images for scene {scene_package.get('scene_number', 'unknown')}: {str(e)}")
+            # Get cosplay instructions from full script
+            cosplay_instructions = full_script.get("cosplay_instructions", "")
+            
+            # Scenes are independent, so overlap their image API round-trips
+            logger.info(f"Generating images for {len(scene_packages)} scenes concurrently...")
+            scene_results: List[Any] = [None] * len(scene_packages)
+            
+            # Handle each scene as soon as it lands; assets are collected in scene order below
+            for completed, next_scene in enumerate(asyncio.as_completed([
+                self._generate_scene_images(index, scene_package, session_id,
+                                            cost_saving_mode, cosplay_instructions)
+                for index, scene_package in enumerate(scene_packages)
+            ]), start=1):
+                index, image_assets = await next_scene
+                scene_results[index] = image_assets
+                scene_number = scene_packages[index].get("scene_number", "unknown")
+                
+                if isinstance(image_assets, Exception):
+                    logger.error(f"❌ Failed to generate images for scene {scene_number}: {str(image_assets)}")
                     build_report["errors"].append({
                         "stage": "image_generation",
-                        "scene": scene_package.get("scene_number", "unknown"),
-                        "error": str(e)
+                        "scene": scene_number,
+                        "error": str(image_assets)
                     })
+                    continue
+                
+                # Validate image assets (warning only)
+                for asset in image_assets:
+                    if not self._validate_against_schema(asset, "ImageAsset"):
+                        logger.warning(f"Image asset {asset.get('frame_id', 'unknown')} failed schema validation, proceeding anyway")
+                
+                logger.info(f"✅ Generated {len(image_assets)} images for scene {scene_number} "
+                            f"({completed}/{len(scene_packages)})")
+            
+            for image_assets in scene_results:
+                if not isinstance(image_assets, Exception):
+                    all_image_assets.extend(image_assets)
             
             stage_time = time.time() - stage_start
             build_report["stages"]["image_generation"] = {
@@ -395,6 +402,20 @@ class OrchestratorAgent:
             logger.error(f"❌ Video creation failed: {str(e)}")
             raise
     
+    async def _generate_scene_images(self, index: int, scene_package: Dict[str, Any],
+                                     session_id: str, cost_saving_mode: bool,
+                                     cosplay_instructions: str) -> Tuple[int, Any]:
+        """Generate one scene's images, returning (index, assets) or (index, exception)"""
+        try:
+            return index, await self.image_create_agent.generate_images_for_scene(
+                scene_package=scene_package,
+                session_id=session_id,
+                cost_saving_mode=cost_saving_mode,
+                cosplay_instructions=cosplay_instructions
+            )
+        except Exception as e:
+            return index, e
+    
     def _validate_against_schema(self, data: Dict[str, Any], schema_name: str) -> bool:
         """Validate data against JSON schema"""
         try:
@@ -405,7 +426,7 @@ class OrchestratorAgent:
             schema = self.schemas[schema_name]
             jsonschema.validate(data, schema)
             
-            logger.debug(f"✅ Data validated against {schema_name} schema")
+            logger.debug("✅ Data validated against %s schema", schema_name)
             return True
             
         except jsonschema.ValidationError as e:
@@ -10,6 +10,7 @@ from google.adk.sessions import InMemorySessionService
 from google.genai import types
 from model.input_models import SceneExpansionInput
 from model.simple_models import SimpleScenePackage
+from model.schema_registry import get_model_schema
 
 logger = logging.getLogger(__name__)
 
@@ -84,8 +85,8 @@ Include scene_number, narration_script, visuals, tts, and timing.""",
         )
         
         # Legacy compatibility for tests
-        self.input_schema = SceneExpansionInput.model_json_schema()
-        self.output_schema = SimpleScenePackage.model_json_schema()
+        self.input_schema = get_model_schema(SceneExpansionInput)
+        self.output_schema = get_model_schema(SimpleScenePackage)
         self.output_key = "scene_package_result"
         
         logger.info("🚀 ADK Scene Script Writer Agent initialized with structured output")
@@ -8,6 +8,7 @@ where images are displayed for durations calculated based on the audio length.
 import os
 import json
 import logging
+import re
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
 import subprocess
@@ -23,9 +24,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Filename sanitizing: drop anything but word chars/space/dash, then join runs with "_"
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\s-]')
+_FILENAME_SEPARATORS_RE = re.compile(r'[-\s]+')
+
 @dataclass
 class ImageTiming:
     """Represents timing information for an image in the video"""
+    __slots__ = ('image_path', 'start_time', 'duration', 'scene_number', 'frame_id')
+    
     image_path: str
     start_time: float
     duration: float
@@ -35,6 +42,8 @@ class ImageTiming:
 @dataclass
 class SceneVideoSegment:
     """Represents a complete scene with images and audio"""
+    __slots__ = ('scene_number', 'voice_file', 'voice_duration', 'images', 'image_timings')
+    
     scene_number: int
     voice_file: str
     voice_duration: float
@@ -588,12 +597,9 @@ class VideoMakerAgent:
     
     def _sanitize_filename(self, title: str) -> str:
         """Sanitize title for use as filename"""
-        import re
-        
-        # Remove or replace problematic characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '', title)
-        sanitized = re.sub(r'[^\w\s-]', '', sanitized)
-        sanitized = re.sub(r'[-\s]+', '_', sanitized)
+        # Remove or replace problematic characters (including reserved ones like <>:"/|?*)
+        sanitized = _UNSAFE_FILENAME_CHARS_RE.sub('', title)
+        sanitized = _FILENAME_SEPARATORS_RE.sub('_', sanitized)
         
         # Limit length to 50 characters
         if len(sanitized) > 50:
@@ -16,6 +16,53 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# TTS text cleanup patterns (compiled once, used for every scene)
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+_UNDERLINE_RE = re.compile(r'_([^_]+)_')
+_BRACKETS_RE = re.compile(r'\[([^\]]+)\]')
+_PARENS_RE = re.compile(r'\(([^)]+)\)')
+_SPECIAL_SYMBOLS_RE = re.compile(r'[#@$%^&*+=<>{}|\\]')
+_QUOTES_RE = re.compile(r'["""''`]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NEWLINES_RE = re.compile(r'\n+')
+
+# Number-to-words patterns, applied in this order by _convert_numbers_to_words
+_ZEROS_RE = re.compile(r'\b0s\b', re.IGNORECASE)
+_ONES_RE = re.compile(r'\b1s\b', re.IGNORECASE)
+_DECADE_RE = re.compile(r'\b(19|20)(\d{2})s\b')
+_YEAR_RE = re.compile(r'\b(19|20)(\d{2})\b')
+_PERCENT_RE = re.compile(r'\b(\d+)%')
+_NUMBER_RE = re.compile(r'\b\d+\b')
+
+# Word tables for _number_to_word and year/decade conversion
+_ONES_WORDS = ("", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine",
+               "ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen",
+               "seventeen", "eighteen", "nineteen")
+_TENS_WORDS = ("", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety")
+_CENTURY_WORDS = {"19": "nineteen", "20": "twenty"}
+_DECADE_WORDS = ("", "tens", "twenties", "thirties", "forties", "fifties",
+                 "sixties", "seventies", "eighties", "nineties")
+
+# LemonFox AI voices - much more variety and cheaper!
+_AVAILABLE_VOICES = frozenset([
+    # English (American) 🇺🇸
+    'heart', 'bella', 'michael', 'alloy', 'aoe', 'deko', 'jessica', 'nicole',
+    'nova', 'river', 'sarah', 'skye', 'echo', 'eric', 'fenrir', 'liam',
+    'onyx', 'puck', 'adam', 'santa',
+
+    # English (British) 🇬🇧
+    'alice', 'emma', 'isabella', 'lily', 'daniel', 'fable', 'george', 'lewis'
+])
+
+# Voice tiers by expressiveness, as (inclusive upper style bound, voices)
+_EXPRESSIVE_VOICES = ('bella', 'nova', 'jessica', 'skye')  # More expressive female voices
+_STYLE_VOICE_TIERS = (
+    (0.5, ('alice', 'emma', 'lily')),  # Calm, clear voices
+    (0.7, ('sarah', 'river', 'heart')),  # Balanced, warm voices
+    (float('inf'), _EXPRESSIVE_VOICES),
+)
+
 class VoiceGenerateAgent:
     """
     Voice Generate Agent - New Architecture
@@ -37,21 +84,7 @@ class VoiceGenerateAgent:
         if not self.api_key:
             raise ValueError("LEMON_FOX_API_KEY is required in .env file (or LEMONFOX_API_KEY/ELEVENLABS_API_KEY as fallback)")
         
-        # LemonFox AI voices - much more variety and cheaper!
-        available_voices = {
-            # English (American) 🇺🇸
-            'heart': 'heart', 'bella': 'bella', 'michael': 'michael', 'alloy': 'alloy',
-            'aoe': 'aoe', 'deko': 'deko', 'jessica': 'jessica', 'nicole': 'nicole',
-            'nova': 'nova', 'river': 'river', 'sarah': 'sarah', 'skye': 'skye',
-            'echo': 'echo', 'eric': 'eric', 'fenrir': 'fenrir', 'liam': 'liam',
-            'onyx': 'onyx', 'puck': 'puck', 'adam': 'adam', 'santa': 'santa',
-            
-            # English (British) 🇬🇧  
-            'alice': 'alice', 'emma': 'emma', 'isabella': 'isabella', 'lily': 'lily',
-            'daniel': 'daniel', 'fable': 'fable', 'george': 'george', 'lewis': 'lewis'
-        }
-        
-        if self.voice_name not in available_voices:
+        if self.voice_name not in _AVAILABLE_VOICES:
             self.voice_name = "sarah"  # Default to Sarah
             logger.info(f"Using default voice 'sarah'")
         else:
@@ -60,6 +93,13 @@ class VoiceGenerateAgent:
         # LemonFox API endpoint - OpenAI compatible!
         self.base_url = "https://api.lemonfox.ai/v1"
         
+        # One pooled HTTP session for every scene (keeps the TLS connection alive)
+        self.http = requests.Session()
+        self.http.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        
         logger.info("Voice Generate Agent initialized with LemonFox AI API")
         logger.info(f"Voice: {self.voice_name}")
         logger.info("💰 Cost: $2.50 per 1M characters (90% cheaper than ElevenLabs!)")
@@ -79,24 +119,24 @@ class VoiceGenerateAgent:
             return ""
         
         # Remove markdown formatting
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # **bold** -> bold
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)      # *italic* -> italic
-        text = re.sub(r'_([^_]+)_', r'\1', text)        # _underline_ -> underline
+        text = _BOLD_RE.sub(r'\1', text)              # **bold** -> bold
+        text = _ITALIC_RE.sub(r'\1', text)            # *italic* -> italic
+        text = _UNDERLINE_RE.sub(r'\1', text)         # _underline_ -> underline
         
         # Remove brackets and parentheses content that are stage directions
-        text = re.sub(r'\[([^\]]+)\]', '', text)        # [stage directions]
-        text = re.sub(r'\(([^)]+)\)', '', text)         # (parentheses)
+        text = _BRACKETS_RE.sub('', text)             # [stage directions]
+        text = _PARENS_RE.sub('', text)               # (parentheses)
         
         # Remove special punctuation that TTS might read
-        text = re.sub(r'[#@$%^&*+=<>{}|\\]', '', text)  # Remove special symbols
-        text = re.sub(r'["""''`]', '"', text)           # Normalize quotes
+        text = _SPECIAL_SYMBOLS_RE.sub('', text)      # Remove special symbols
+        text = _QUOTES_RE.sub('"', text)              # Normalize quotes
         
         # Convert numbers to words for proper TTS pronunciation
         text = self._convert_numbers_to_words(text)
         
         # Clean up multiple spaces and line breaks
-        text = re.sub(r'\s+', ' ', text)                # Multiple spaces -> single space
-        text = re.sub(r'\n+', '. ', text)               # Line breaks -> periods
+        text = _WHITESPACE_RE.sub(' ', text)          # Multiple spaces -> single space
+        text = _NEWLINES_RE.sub('. ', text)           # Line breaks -> periods
         
         # Remove leading/trailing whitespace
         text = text.strip()
@@ -117,52 +157,28 @@ class VoiceGenerateAgent:
         Returns:
             Text with numbers converted to words
         """
-        # Dictionary for basic number conversions
-        number_words = {
-            '0': 'zero', '1': 'one', '2': 'two', '3': 'three', '4': 'four',
-            '5': 'five', '6': 'six', '7': 'seven', '8': 'eight', '9': 'nine',
-            '10': 'ten', '11': 'eleven', '12': 'twelve', '13': 'thirteen', '14': 'fourteen',
-            '15': 'fifteen', '16': 'sixteen', '17': 'seventeen', '18': 'eighteen', '19': 'nineteen',
-            '20': 'twenty', '30': 'thirty', '40': 'forty', '50': 'fifty',
-            '60': 'sixty', '70': 'seventy', '80': 'eighty', '90': 'ninety',
-            '100': 'one hundred', '1000': 'one thousand'
-        }
-        
         # Handle common problematic patterns first
         
         # Fix "0s and 1s" -> "zeros and ones"
-        text = re.sub(r'\b0s\b', 'zeros', text, flags=re.IGNORECASE)
-        text = re.sub(r'\b1s\b', 'ones', text, flags=re.IGNORECASE)
+        text = _ZEROS_RE.sub('zeros', text)
+        text = _ONES_RE.sub('ones', text)
         
         # Handle decades like "1920s" -> "nineteen twenties"
         def convert_decade(match):
-            century = match.group(1)
+            century_word = _CENTURY_WORDS[match.group(1)]
             decade_digit = int(match.group(2)[0])  # First digit of decade (e.g., '2' from '20')
-            
-            if century == "19":
-                century_word = "nineteen"
-            elif century == "20":
-                century_word = "twenty"
-            else:
-                return match.group(0)  # Fallback
-            
-            # Convert decade digit to word + "ties"
-            decade_words = ["", "tens", "twenties", "thirties", "forties", "fifties", 
-                          "sixties", "seventies", "eighties", "nineties"]
-            
-            if decade_digit < len(decade_words):
-                return f"{century_word} {decade_words[decade_digit]}"
-            else:
-                return match.group(0)  # Fallback
+            return f"{century_word} {_DECADE_WORDS[decade_digit]}"
         
-        text = re.sub(r'\b(19|20)(\d{2})s\b', convert_decade, text)
+        text = _DECADE_RE.sub(convert_decade, text)
         
         # Handle years like "1969" -> "nineteen sixty nine"
-        text = re.sub(r'\b(19)(\d{2})\b', lambda m: f"nineteen {self._convert_two_digit_to_words(m.group(2))}", text)
-        text = re.sub(r'\b(20)(\d{2})\b', lambda m: f"twenty {self._convert_two_digit_to_words(m.group(2))}", text)
+        text = _YEAR_RE.sub(
+            lambda m: f"{_CENTURY_WORDS[m.group(1)]} {self._convert_two_digit_to_words(m.group(2))}",
+            text
+        )
         
         # Handle percentages like "50%" -> "fifty percent"
-        text = re.sub(r'\b(\d+)%', lambda m: f"{self._number_to_word(int(m.group(1)))} percent", text)
+        text = _PERCENT_RE.sub(lambda m: f"{self._number_to_word(int(m.group(1)))} percent", text)
         
         # Handle simple numbers (1-100)
         def replace_number(match):
@@ -178,7 +194,7 @@ class VoiceGenerateAgent:
                 return num
         
         # Replace standalone numbers (not part of other patterns)
-        text = re.sub(r'\b\d+\b', replace_number, text)
+        text = _NUMBER_RE.sub(replace_number, text)
         
         return text
     
@@ -195,16 +211,12 @@ class VoiceGenerateAgent:
         if num == 0:
             return "zero"
         elif num <= 19:
-            ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine",
-                   "ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen",
-                   "seventeen", "eighteen", "nineteen"]
-            return ones[num]
+            return _ONES_WORDS[num]
         elif num <= 99:
-            tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
             if num % 10 == 0:
-                return tens[num // 10]
+                return _TENS_WORDS[num // 10]
             else:
-                return f"{tens[num // 10]} {self._number_to_word(num % 10)}"
+                return f"{_TENS_WORDS[num // 10]} {_ONES_WORDS[num % 10]}"
         elif num == 100:
             return "one hundred"
         else:
@@ -349,17 +361,13 @@ class VoiceGenerateAgent:
     def _extract_dialogue_text(self, narration_script: List[Dict[str, Any]]) -> str:
         """Extract dialogue text from narration script"""
         try:
-            dialogue_lines = []
-            
-            for item in narration_script:
-                if isinstance(item, dict) and 'line' in item:
-                    line = item['line'].strip()
-                    if line:
-                        dialogue_lines.append(line)
-                elif isinstance(item, str):
-                    line = item.strip()
-                    if line:
-                        dialogue_lines.append(line)
+            # Narration items are either {'line': ...} dicts or plain strings
+            raw_lines = (
+                item['line'] if isinstance(item, dict) else item
+                for item in narration_script
+                if (isinstance(item, dict) and 'line' in item) or isinstance(item, str)
+            )
+            dialogue_lines = [line for line in map(str.strip, raw_lines) if line]
             
             # Join with appropriate pauses
             raw_dialogue_text = ". ".join(dialogue_lines)
@@ -389,15 +397,11 @@ class VoiceGenerateAgent:
             stability = elevenlabs_settings.get('stability', 0.5)
             
             # Choose more expressive voice based on content mood
-            if style_score > 0.7 or stability < 0.4:
-                # High expressiveness - use more dramatic voices
-                voice_options = ['bella', 'nova', 'jessica', 'skye']  # More expressive female voices
-            elif style_score > 0.5:
-                # Medium expressiveness - use balanced voices
-                voice_options = ['sarah', 'river', 'heart']  # Balanced, warm voices
+            if stability < 0.4:
+                # Unstable delivery - always use the most dramatic voices
+                voice_options = _EXPRESSIVE_VOICES
             else:
-                # Lower expressiveness - use calm voices
-                voice_options = ['alice', 'emma', 'lily']  # Calm, clear voices
+                voice_options = next(v for t, v in _STYLE_VOICE_TIERS if style_score <= t)
             
             # Select voice (use configured or pick from appropriate category)
             selected_voice = self.voice_name
@@ -440,11 +444,6 @@ class VoiceGenerateAgent:
             # Prepare API request - OpenAI compatible endpoint
             url = f"{self.base_url}/audio/speech"
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             # Use the optimized voice from settings if available
             optimized_voice = settings.get('voice', voice_name)
             
@@ -467,7 +466,7 @@ class VoiceGenerateAgent:
             logger.info(f"💰 Estimated cost: ${estimated_cost:.4f} (vs ${estimated_cost*10:.4f} with ElevenLabs)")
             
             # Make API request
-            response = requests.post(url, json=data, headers=headers, timeout=60)
+            response = self.http.post(url, json=data, timeout=60)
             
             if response.status_code == 200:
                 # Save audio file
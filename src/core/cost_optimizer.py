@@ -4,11 +4,70 @@ Reduces API costs by validating inputs and optimizing requests before sending to
 """
 
 import logging
+import re
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Context name fragment -> keywords its prompt must mention (first match wins)
+_REQUIRED_KEYWORDS = (
+    ('full_script', ('JSON', 'scene', 'title')),
+    ('scene_', ('scene_number', 'narration_script', 'visuals', 'JSON')),
+    ('image_', ('image', 'prompt', 'generate'))
+)
+
+# Filler phrases stripped from prompts when repeated
+_REDUNDANT_PHRASES = (
+    'Remember to',
+    'Make sure to',
+    'Don\'t forget to',
+    'It is important to',
+    'Please ensure that',
+)
+
+# Errors that retrying won't fix
+_NON_RETRYABLE_ERRORS = (
+    'invalid api key',
+    'quota exceeded',
+    'billing',
+    'permission denied',
+    'unauthorized',
+    'forbidden',
+    'content policy',
+    'safety filter'
+)
+
+# Network/temporary errors worth retrying
+_RETRYABLE_ERRORS = (
+    'timeout',
+    'connection',
+    'network',
+    'server error',
+    'internal error',
+    'rate limit',
+    'too many requests',
+    'service unavailable',
+    'bad gateway',
+    'gateway timeout'
+)
+
+# Refusal/error phrases that make a response not worth parsing
+_ERROR_INDICATORS = (
+    'I cannot',
+    'I\'m unable',
+    'I apologize',
+    'Error:',
+    'Sorry,',
+    'I don\'t have',
+    'As an AI'
+)
+# One capture group per indicator, matched against already-lowercased text
+# (no IGNORECASE: Unicode case folding would let 'i' match 'ı'/'İ' and 's' match 'ſ')
+_ERROR_INDICATOR_RE = re.compile(
+    '|'.join(f'({re.escape(indicator.lower())})' for indicator in _ERROR_INDICATORS)
+)
+
 class CostOptimizer:
     """
     Cost optimization system that validates and optimizes requests before sending to AI
@@ -26,7 +85,7 @@ class CostOptimizer:
         Returns:
             Tuple[bool, str]: (is_valid, reason)
         """
-        logger.debug(f"🔍 Validating prompt quality for {context_name}")
+        logger.debug("🔍 Validating prompt quality for %s", context_name)
         
         # Basic length validation
         if len(prompt.strip()) < 50:
@@ -36,32 +95,24 @@ class CostOptimizer:
             return False, "Prompt too long (> 50,000 characters)"
         
         # Check for required elements in prompts
-        required_keywords = {
-            'full_script': ['JSON', 'scene', 'title'],
-            'scene_': ['scene_number', 'narration_script', 'visuals', 'JSON'],
-            'image_': ['image', 'prompt', 'generate']
-        }
-        
-        context_type = None
-        for key in required_keywords:
-            if key in context_name.lower():
-                context_type = key
-                break
-        
-        if context_type and context_type in required_keywords:
-            missing_keywords = []
-            for keyword in required_keywords[context_type]:
-                if keyword.lower() not in prompt.lower():
-                    missing_keywords.append(keyword)
+        context_lower = context_name.lower()
+        prompt_lower = prompt.lower()
+        required = next(
+            (keywords for key, keywords in _REQUIRED_KEYWORDS if key in context_lower),
+            None
+        )
+        
+        if required:
+            missing_keywords = [keyword for keyword in required if keyword.lower() not in prompt_lower]
             
             if missing_keywords:
                 return False, f"Missing required keywords: {missing_keywords}"
         
         # Check for JSON format requirement
-        if 'JSON' in prompt and 'json' not in prompt.lower():
+        if 'JSON' in prompt and 'json' not in prompt_lower:
             return False, "JSON requirement mentioned but not properly specified"
         
-        logger.debug(f"✅ Prompt validation passed for {context_name}")
+        logger.debug("✅ Prompt validation passed for %s", context_name)
         return True, "Valid"
     
     @staticmethod
@@ -76,7 +127,7 @@ class CostOptimizer:
         Returns:
             str: Optimized prompt
         """
-        logger.debug(f"🔧 Optimizing prompt for cost efficiency: {context_name}")
+        logger.debug("🔧 Optimizing prompt for cost efficiency: %s", context_name)
         
         optimized = prompt
         
@@ -93,15 +144,7 @@ class CostOptimizer:
         optimized = '\n'.join(cleaned_lines)
         
         # Remove redundant instructions
-        redundant_phrases = [
-            'Remember to',
-            'Make sure to',
-            'Don\'t forget to',
-            'It is important to',
-            'Please ensure that',
-        ]
-        
-        for phrase in redundant_phrases:
+        for phrase in _REDUNDANT_PHRASES:
             # Only remove if there are multiple instances
             if optimized.count(phrase) > 1:
                 optimized = optimized.replace(phrase, '', 1)  # Remove first instance only
@@ -112,7 +155,7 @@ class CostOptimizer:
         savings = original_length - optimized_length
         
         if savings > 0:
-            logger.debug(f"🔧 Prompt optimized: saved {savings} characters ({savings/original_length*100:.1f}%)")
+            logger.debug("🔧 Prompt optimized: saved %d characters (%.1f%%)", savings, savings / original_length * 100)
         
         return optimized
     
@@ -128,7 +171,7 @@ class CostOptimizer:
         Returns:
             Tuple[bool, str]: (is_valid, reason)
         """
-        logger.debug(f"🔍 Pre-validating response for {context_name}")
+        logger.debug("🔍 Pre-validating response for %s", context_name)
         
         if not response or not response.strip():
             return False, "Empty response"
@@ -138,7 +181,8 @@ class CostOptimizer:
             return False, "Response too short (< 20 characters)"
         
         # Check for JSON if expected
-        if 'scene_' in context_name.lower() or 'full_script' in context_name.lower():
+        context_lower = context_name.lower()
+        if 'scene_' in context_lower or 'full_script' in context_lower:
             if '{' not in response or '}' not in response:
                 return False, "No JSON structure found in response"
             
@@ -149,23 +193,13 @@ class CostOptimizer:
             if abs(open_braces - close_braces) > 3:  # Allow some tolerance
                 return False, f"Severely unbalanced JSON braces ({open_braces} open, {close_braces} close)"
         
-        # Check for obvious errors
-        error_indicators = [
-            'I cannot',
-            'I\'m unable',
-            'I apologize',
-            'Error:',
-            'Sorry,',
-            'I don\'t have',
-            'As an AI'
-        ]
-        
-        response_lower = response.lower()
-        for indicator in error_indicators:
-            if indicator.lower() in response_lower[:200]:  # Check first 200 chars
-                return False, f"Response contains error indicator: {indicator}"
-        
-        logger.debug(f"✅ Response pre-validation passed for {context_name}")
+        # Check for obvious errors (first 200 chars, one scan over the lowercased text)
+        error_match = _ERROR_INDICATOR_RE.search(response[:200].lower())
+        if error_match:
+            indicator = _ERROR_INDICATORS[error_match.lastindex - 1]
+            return False, f"Response contains error indicator: {indicator}"
+        
+        logger.debug("✅ Response pre-validation passed for %s", context_name)
         return True, "Valid"
     
     @staticmethod
@@ -251,38 +285,14 @@ class CostOptimizer:
             return False
         
         # Don't retry for certain types of errors that won't be fixed by retrying
-        non_retryable_errors = [
-            'invalid api key',
-            'quota exceeded',
-            'billing',
-            'permission denied',
-            'unauthorized',
-            'forbidden',
-            'content policy',
-            'safety filter'
-        ]
-        
         error_lower = error_message.lower()
-        for non_retryable in non_retryable_errors:
+        for non_retryable in _NON_RETRYABLE_ERRORS:
             if non_retryable in error_lower:
                 logger.info(f"❌ Not retrying due to non-retryable error: {non_retryable}")
                 return False
         
         # Retry for network/temporary errors
-        retryable_errors = [
-            'timeout',
-            'connection',
-            'network',
-            'server error',
-            'internal error',
-            'rate limit',
-            'too many requests',
-            'service unavailable',
-            'bad gateway',
-            'gateway timeout'
-        ]
-        
-        for retryable in retryable_errors:
+        for retryable in _RETRYABLE_ERRORS:
             if retryable in error_lower:
                 logger.info(f"🔄 Retrying due to temporary error: {retryable}")
                 return True
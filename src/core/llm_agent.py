@@ -5,13 +5,18 @@ Clean abstraction over Google AI with direct Pydantic model support
 
 import json
 import logging
+import re
 from typing import Type, Dict, Any, Optional
 import google.genai as genai
 from google.genai import types
 from pydantic import BaseModel
+from model.schema_registry import get_model_schema
 
 logger = logging.getLogger(__name__)
 
+# Markdown-fenced JSON response: captures first '{' to last '}', ignoring any prose around it
+_JSON_FENCE_RE = re.compile(r'```(?:json)?.*?(\{.*\})', re.DOTALL)
+
 
 class LlmAgent:
     """
@@ -80,7 +85,7 @@ class LlmAgent:
                 ],
                 config=types.GenerateContentConfig(
                     system_instruction=self.instruction,
-                    response_schema=self.output_schema.model_json_schema() if self.output_schema else None,
+                    response_schema=get_model_schema(self.output_schema) if self.output_schema else None,
                     temperature=0.8,
                     top_p=0.9,
                     top_k=40,
@@ -92,12 +97,10 @@ class LlmAgent:
             if self.output_schema:
                 # Clean response text (remove markdown if present)
                 response_text = response.text.strip()
-                if response_text.startswith('```json'):
+                fence_match = _JSON_FENCE_RE.match(response_text)
+                if fence_match:
                     # Extract JSON from markdown
-                    start = response_text.find('{')
-                    end = response_text.rfind('}') + 1
-                    if start != -1 and end != 0:
-                        response_text = response_text[start:end]
+                    response_text = fence_match.group(1)
                 
                 result = self.output_schema.model_validate_json(response_text)
                 logger.info(f"✅ {self.name} completed successfully")
@@ -116,6 +119,6 @@ class LlmAgent:
             "name": self.name,
             "model": self.model,
             "description": self.description,
-            "output_schema": self.output_schema.model_json_schema() if self.output_schema else None,
+            "output_schema": get_model_schema(self.output_schema) if self.output_schema else None,
             "output_key": self.output_key
         }
@@ -7,6 +7,8 @@ import os
 import uuid
 import json
 import shutil
+import time
+import zipfile
 from datetime import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -16,6 +18,12 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Last formatted log timestamp: [epoch second, ISO string]
+_LAST_TS = [0, ""]
+
+# Text artifacts worth compressing on export; media files are already compressed
+_DEFLATE_SUFFIXES = {".json", ".log"}
+
 class SessionManager:
     """
     Manages sessions and file storage for ShortFactory Agent
@@ -54,6 +62,7 @@ class SessionManager:
         """
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(exist_ok=True)
+        self._session_dirs: Dict[str, Path] = {}  # session_id -> session directory
         logger.info(f"Session Manager initialized with base directory: {self.base_dir}")
     
     def create_session(self, subject: str, language: str = "English") -> str:
@@ -72,7 +81,7 @@ class SessionManager:
         session_id = f"{date_prefix}-{str(uuid.uuid4())}"
         
         # Create session directory
-        session_dir = self.base_dir / session_id
+        session_dir = self.get_session_dir(session_id)
         session_dir.mkdir(exist_ok=True)
         
         # Create subdirectories
@@ -109,12 +118,8 @@ class SessionManager:
         with open(metadata_path, 'w') as f:
             json.dump(metadata, f, indent=2)
         
-        # Create session log
-        log_path = session_dir / "logs" / "session.log"
-        with open(log_path, 'w') as f:
-            f.write(f"Session {session_id} created at {datetime.now().isoformat()}\n")
-            f.write(f"Subject: {subject}\n")
-            f.write(f"Language: {language}\n")
+        # Session log is created lazily by the first _log call;
+        # subject/language/created_at already live in metadata.json
         
         logger.info(f"Created new session: {session_id}")
         logger.info(f"Session directory: {session_dir}")
@@ -131,7 +136,10 @@ class SessionManager:
         Returns:
             Path: Session directory path
         """
-        return self.base_dir / session_id
+        session_dir = self._session_dirs.get(session_id)
+        if session_dir is None:
+            session_dir = self._session_dirs[session_id] = self.base_dir / session_id
+        return session_dir
     
     def save_script(self, session_id: str, script_data: Dict[str, Any]) -> str:
         """
@@ -294,10 +302,12 @@ class SessionManager:
         Returns:
             list: List of session IDs
         """
-        sessions = []
-        for session_dir in self.base_dir.iterdir():
-            if session_dir.is_dir() and (session_dir / "metadata.json").exists():
-                sessions.append(session_dir.name)
+        # scandir entries carry the file type, so is_dir() needs no extra stat()
+        with os.scandir(self.base_dir) as entries:
+            sessions = [
+                entry.name for entry in entries
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "metadata.json"))
+            ]
         return sorted(sessions, reverse=True)  # Most recent first
     
     def get_session_status(self, session_id: str) -> Dict[str, Any]:
@@ -334,9 +344,7 @@ class SessionManager:
             keys = key.split('.')
             current = metadata
             for k in keys[:-1]:
-                if k not in current:
-                    current[k] = {}
-                current = current[k]
+                current = current.setdefault(k, {})
             current[keys[-1]] = value
         
         # Save updated metadata
@@ -353,16 +361,22 @@ class SessionManager:
         return current
     
     def _log(self, session_id: str, message: str):
-        """Add log entry to session"""
+        """Add log entry to session (append mode creates the log on first write)"""
         session_dir = self.get_session_dir(session_id)
         log_path = session_dir / "logs" / "session.log"
         
+        # Format the timestamp at most once per second
+        sec = int(time.time())
+        if sec != _LAST_TS[0]:
+            _LAST_TS[0] = sec
+            _LAST_TS[1] = datetime.fromtimestamp(sec).isoformat()
+        
         with open(log_path, 'a') as f:
-            f.write(f"[{datetime.now().isoformat()}] {message}\n")
+            f.write(f"[{_LAST_TS[1]}] {message}\n")
     
     def cleanup_session(self, session_id: str):
         """Delete session and all its files"""
-        session_dir = self.get_session_dir(session_id)
+        session_dir = self._session_dirs.pop(session_id, None) or self.base_dir / session_id
         if session_dir.exists():
             shutil.rmtree(session_dir)
             logger.info(f"Session {session_id} cleaned up")
@@ -370,7 +384,13 @@ class SessionManager:
     def export_session(self, session_id: str, export_path: str):
         """Export session to zip file"""
         session_dir = self.get_session_dir(session_id)
-        shutil.make_archive(export_path, 'zip', session_dir)
+        # Check before opening the archive so no empty zip is left behind
+        if not session_dir.is_dir():
+            raise FileNotFoundError(f"Session {session_id} not found")
+        with zipfile.ZipFile(f"{export_path}.zip", 'w', zipfile.ZIP_STORED) as zf:
+            for path in sorted(session_dir.rglob('*')):
+                compress_type = zipfile.ZIP_DEFLATED if path.suffix in _DEFLATE_SUFFIXES else zipfile.ZIP_STORED
+                zf.write(path, path.relative_to(session_dir), compress_type=compress_type)
         logger.info(f"Session {session_id} exported to {export_path}.zip")
 
 
@@ -101,6 +101,24 @@ class HookTechnique(str, Enum):
     CONTRADICTION = "contradiction"  # "Truth that contradicts common sense"
     MYSTERY_SETUP = "mystery_setup"  # "There's a secret that nobody knows..."
 
+# Recommended ElevenLabs settings per voice tone (built once, not per for_tone call)
+_TONE_SETTINGS = {
+    VoiceTone.EXCITED: dict(stability=0.3, similarity_boost=0.8, style=0.8, speed=1.1, loudness=0.2),
+    VoiceTone.SERIOUS: dict(stability=0.8, similarity_boost=0.9, style=0.3, speed=0.9, loudness=0.0),
+    VoiceTone.SAD: dict(stability=0.7, similarity_boost=0.8, style=0.6, speed=0.8, loudness=-0.2),
+    VoiceTone.MYSTERIOUS: dict(stability=0.6, similarity_boost=0.7, style=0.7, speed=0.85, loudness=-0.1),
+    VoiceTone.CURIOUS: dict(stability=0.4, similarity_boost=0.8, style=0.7, speed=1.0, loudness=0.0),
+    VoiceTone.FRIENDLY: dict(stability=0.5, similarity_boost=0.8, style=0.6, speed=1.0, loudness=0.1),
+    VoiceTone.SURPRISED: dict(stability=0.2, similarity_boost=0.7, style=0.9, speed=1.2, loudness=0.3),
+    VoiceTone.CONFIDENT: dict(stability=0.7, similarity_boost=0.9, style=0.4, speed=0.95, loudness=0.1),
+    VoiceTone.WORRIED: dict(stability=0.6, similarity_boost=0.8, style=0.5, speed=0.85, loudness=-0.1),
+    VoiceTone.PLAYFUL: dict(stability=0.3, similarity_boost=0.7, style=0.8, speed=1.1, loudness=0.2),
+    VoiceTone.DRAMATIC: dict(stability=0.4, similarity_boost=0.8, style=0.9, speed=0.9, loudness=0.2),
+    VoiceTone.CALM: dict(stability=0.8, similarity_boost=0.9, style=0.2, speed=0.85, loudness=-0.1),
+    VoiceTone.ENTHUSIASTIC: dict(stability=0.2, similarity_boost=0.8, style=0.9, speed=1.15, loudness=0.3)
+}
+_DEFAULT_TONE_SETTINGS = dict(stability=0.5, similarity_boost=0.8, style=0.5, speed=1.0, loudness=0.0)
+
 class ElevenLabsSettings(BaseModel):
     stability: float = Field(ge=0.0, le=1.0, description="Consistency vs emotional expression")
     similarity_boost: float = Field(ge=0.0, le=1.0, description="Closeness to reference voice")
@@ -111,22 +129,7 @@ class ElevenLabsSettings(BaseModel):
     @classmethod
     def for_tone(cls, tone: VoiceTone) -> 'ElevenLabsSettings':
         """Return recommended settings for each voice tone"""
-        settings_map = {
-            VoiceTone.EXCITED: cls(stability=0.3, similarity_boost=0.8, style=0.8, speed=1.1, loudness=0.2),
-            VoiceTone.SERIOUS: cls(stability=0.8, similarity_boost=0.9, style=0.3, speed=0.9, loudness=0.0),
-            VoiceTone.SAD: cls(stability=0.7, similarity_boost=0.8, style=0.6, speed=0.8, loudness=-0.2),
-            VoiceTone.MYSTERIOUS: cls(stability=0.6, similarity_boost=0.7, style=0.7, speed=0.85, loudness=-0.1),
-            VoiceTone.CURIOUS: cls(stability=0.4, similarity_boost=0.8, style=0.7, speed=1.0, loudness=0.0),
-            VoiceTone.FRIENDLY: cls(stability=0.5, similarity_boost=0.8, style=0.6, speed=1.0, loudness=0.1),
-            VoiceTone.SURPRISED: cls(stability=0.2, similarity_boost=0.7, style=0.9, speed=1.2, loudness=0.3),
-            VoiceTone.CONFIDENT: cls(stability=0.7, similarity_boost=0.9, style=0.4, speed=0.95, loudness=0.1),
-            VoiceTone.WORRIED: cls(stability=0.6, similarity_boost=0.8, style=0.5, speed=0.85, loudness=-0.1),
-            VoiceTone.PLAYFUL: cls(stability=0.3, similarity_boost=0.7, style=0.8, speed=1.1, loudness=0.2),
-            VoiceTone.DRAMATIC: cls(stability=0.4, similarity_boost=0.8, style=0.9, speed=0.9, loudness=0.2),
-            VoiceTone.CALM: cls(stability=0.8, similarity_boost=0.9, style=0.2, speed=0.85, loudness=-0.1),
-            VoiceTone.ENTHUSIASTIC: cls(stability=0.2, similarity_boost=0.8, style=0.9, speed=1.15, loudness=0.3)
-        }
-        return settings_map.get(tone, cls(stability=0.5, similarity_boost=0.8, style=0.5, speed=1.0, loudness=0.0))
+        return cls(**_TONE_SETTINGS.get(tone, _DEFAULT_TONE_SETTINGS))
 
 class VideoGenerationPrompt(BaseModel):
     """
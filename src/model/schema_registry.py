@@ -0,0 +1,29 @@
+"""
+Schema Registry - JSON schemas generated once per Pydantic model
+Pydantic regenerates model_json_schema() on every call; agents only need it once
+"""
+
+import copy
+from typing import Dict, Any, Type
+from pydantic import BaseModel
+
+
+# Model class -> generated JSON schema (never handed out directly)
+_SCHEMA_REGISTRY: Dict[Type[BaseModel], Dict[str, Any]] = {}
+
+
+def get_model_schema(model_cls: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Get the JSON schema for a Pydantic model, generating it on first use
+
+    Args:
+        model_cls: Pydantic model class
+
+    Returns:
+        Dict: Private copy of the cached JSON schema, safe for the caller to modify
+    """
+    schema = _SCHEMA_REGISTRY.get(model_cls)
+    if schema is None:
+        schema = _SCHEMA_REGISTRY[model_cls] = model_cls.model_json_schema()
+    # Consumers such as google-genai may rewrite schema dicts in place
+    return copy.deepcopy(schema)
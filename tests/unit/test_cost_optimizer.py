@@ -0,0 +1,74 @@
+"""
+테스트: Cost Optimizer
+API 호출 전 프롬프트/응답 검증 로직 테스트
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.cost_optimizer import CostOptimizer
+
+
+class TestCostOptimizer:
+    """Cost Optimizer 단위 테스트"""
+
+    def test_prompt_missing_required_keywords_is_rejected(self):
+        """컨텍스트별 필수 키워드 누락 프롬프트 거부 테스트"""
+        prompt = "Write the scene_number and narration_script for this scene as JSON output please."
+
+        is_valid, reason = CostOptimizer.validate_prompt_quality(prompt, "scene_3")
+
+        assert is_valid is False
+        assert reason == "Missing required keywords: ['visuals']"
+
+    def test_should_retry_request_classifies_errors(self):
+        """재시도 가능/불가능 에러 분류 테스트"""
+        assert CostOptimizer.should_retry_request("403 Forbidden", 1) is False
+        assert CostOptimizer.should_retry_request("Read timeout", 1) is True
+        assert CostOptimizer.should_retry_request("Read timeout", 3) is False
+
+    def test_response_with_error_indicator_is_rejected(self):
+        """에러 문구가 포함된 응답 거부 테스트"""
+        is_valid, reason = CostOptimizer.validate_response_before_parsing(
+            "i APOLOGIZE, but I can't help with generating this image right now.",
+            "image_1"
+        )
+
+        assert is_valid is False
+        assert reason == "Response contains error indicator: I apologize"
+
+    def test_unicode_case_fold_lookalikes_do_not_match_indicators(self):
+        """유니코드 대소문자 유사 문자(ı, ſ) 응답 처리 테스트"""
+        for response in ("ı cannot do that, it is outside my scope",
+                         "ſorry, the requested image is not available"):
+            is_valid, reason = CostOptimizer.validate_response_before_parsing(response, "image_1")
+
+            assert is_valid is True
+            assert reason == "Valid"
+
+    def test_dotted_capital_i_still_matches_indicator(self):
+        """'İ' 소문자화 후에도 에러 문구 감지 테스트"""
+        is_valid, reason = CostOptimizer.validate_response_before_parsing(
+            "As an Aİ model, I won't draw that picture for you.",
+            "image_1"
+        )
+
+        assert is_valid is False
+        assert reason == "Response contains error indicator: As an AI"
+
+    def test_error_indicator_after_first_200_chars_is_ignored(self):
+        """200자 이후의 에러 문구는 무시 테스트"""
+        response = '{"scene_number": 1, "text": "' + "x" * 250 + ' Sorry, that was a pun"}'
+
+        is_valid, reason = CostOptimizer.validate_response_before_parsing(response, "scene_1")
+
+        assert is_valid is True
+        assert reason == "Valid"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,42 @@
+"""
+테스트: Image Create Agent
+프롬프트 안전 필터(_sanitize_prompt) 동작 테스트
+"""
+
+import pytest
+import sys
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from agents.image_create_agent import ImageCreateAgent
+
+
+class TestSanitizePrompt:
+    """ImageCreateAgent._sanitize_prompt 단위 테스트"""
+
+    @pytest.fixture
+    def agent(self):
+        with patch.dict(os.environ, {'GEMINI_API_KEY': 'test-key'}), \
+             patch('agents.image_create_agent.genai.Client'):
+            return ImageCreateAgent()
+
+    def test_blocked_terms_removed(self, agent):
+        """차단어 제거 및 소문자 변환 테스트"""
+        assert agent._sanitize_prompt("A VIOLENT and explicit cartoon scene") == "a  and  cartoon scene"
+
+    def test_nested_blocked_terms_removed(self, agent):
+        """다른 차단어 안에 숨겨진 차단어도 순서대로 제거되는지 테스트"""
+        assert agent._sanitize_prompt("a vionsfwlent scene here") == "a  scene here"
+        assert agent._sanitize_prompt("harnsfwmful") == "informative illustration,"
+
+    def test_short_prompt_gets_prefix(self, agent):
+        """짧은 프롬프트에 기본 접두어 추가 테스트"""
+        assert agent._sanitize_prompt("a cat") == "informative illustration, a cat"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,73 @@
+"""
+테스트: LlmAgent
+마크다운 코드 블록 응답에서 JSON 추출 후 Pydantic 검증 테스트
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+from pydantic import BaseModel
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.llm_agent import LlmAgent
+
+
+class NestedOutput(BaseModel):
+    """테스트용 출력 스키마"""
+    a: dict
+
+
+class TestJsonFenceExtraction:
+    """LlmAgent.run 응답 파싱 단위 테스트 (Mock 기반)"""
+
+    async def _run(self, response_text: str) -> NestedOutput:
+        """genai 클라이언트가 response_text를 반환하도록 패치 후 run 실행"""
+        with patch('core.llm_agent.genai.Client') as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.models.generate_content.return_value = MagicMock(text=response_text)
+            mock_client_class.return_value = mock_client
+
+            agent = LlmAgent(name="test_agent", output_schema=NestedOutput)
+            return await agent.run("test prompt")
+
+    @pytest.mark.asyncio
+    async def test_json_fence_extracts_object(self):
+        """```json 코드 블록에서 객체 추출 테스트"""
+        result = await self._run('```json\n{"a": {"b": 1}}\n```')
+
+        assert result == NestedOutput(a={"b": 1})
+
+    @pytest.mark.asyncio
+    async def test_plain_fence_extracts_object(self):
+        """언어 표기 없는 ``` 코드 블록에서 객체 추출 테스트"""
+        result = await self._run('```\n{"a": {"b": 1}}\n```')
+
+        assert result == NestedOutput(a={"b": 1})
+
+    @pytest.mark.asyncio
+    async def test_trailing_prose_after_fence_is_ignored(self):
+        """코드 블록 뒤 설명 문구 무시 테스트"""
+        result = await self._run('```json\n{"a": {"b": 1}}\n```\nHope this helps!')
+
+        assert result == NestedOutput(a={"b": 1})
+
+    @pytest.mark.asyncio
+    async def test_preamble_before_object_is_ignored(self):
+        """코드 블록 안 객체 앞 설명 문구 무시 테스트"""
+        result = await self._run('```json\nHere you go:\n{"a": {"b": 1}}\n```')
+
+        assert result == NestedOutput(a={"b": 1})
+
+    @pytest.mark.asyncio
+    async def test_unfenced_response_is_validated_as_is(self):
+        """코드 블록 없는 응답 그대로 검증 테스트"""
+        result = await self._run('  {"a": {"b": 1}}\n')
+
+        assert result == NestedOutput(a={"b": 1})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,37 @@
+"""
+테스트: Schema Registry
+모델별 JSON 스키마 캐시 및 호출자별 사본 반환 테스트
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from model.input_models import FullScriptInput
+from model.schema_registry import get_model_schema
+
+
+class TestSchemaRegistry:
+    """Schema Registry 단위 테스트"""
+
+    def test_schema_matches_model_json_schema(self):
+        """캐시된 스키마가 Pydantic 생성 스키마와 동일한지 테스트"""
+        assert get_model_schema(FullScriptInput) == FullScriptInput.model_json_schema()
+
+    def test_caller_mutation_does_not_leak_to_later_callers(self):
+        """한 호출자의 스키마 수정이 다른 호출자에게 전파되지 않는지 테스트"""
+        first = get_model_schema(FullScriptInput)
+        first["properties"].clear()
+        first["title"] = "mutated"
+
+        second = get_model_schema(FullScriptInput)
+
+        assert second is not first
+        assert second == FullScriptInput.model_json_schema()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
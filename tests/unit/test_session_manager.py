@@ -109,6 +109,49 @@ class TestSessionManager:
             expected_path = Path(self.temp_dir) / session_id
             assert expected_path.exists()
 
+    def test_get_session_dir_is_cached_and_evicted_on_cleanup(self):
+        """세션 디렉토리 경로 캐시 및 정리 시 제거 테스트"""
+        session_id = self.session_manager.create_session("Test Subject")
+        
+        session_dir = self.session_manager.get_session_dir(session_id)
+        assert session_dir == Path(self.temp_dir) / session_id
+        assert self.session_manager.get_session_dir(session_id) is session_dir
+        
+        self.session_manager.cleanup_session(session_id)
+        assert session_id not in self.session_manager._session_dirs
+        assert not session_dir.exists()
+
+    def test_export_session_stores_media_uncompressed(self):
+        """세션 내보내기 시 미디어는 무압축, 텍스트는 압축 저장 테스트"""
+        import zipfile
+        session_id = self.session_manager.create_session("Test Subject")
+        self.session_manager.save_image(session_id, 1, b"\x89PNG fake image bytes")
+        
+        export_path = str(Path(self.temp_dir) / "export")
+        self.session_manager.export_session(session_id, export_path)
+        
+        with zipfile.ZipFile(f"{export_path}.zip") as zf:
+            infos = {info.filename: info for info in zf.infolist()}
+        assert infos["images/scene_1.png"].compress_type == zipfile.ZIP_STORED
+        assert infos["metadata.json"].compress_type == zipfile.ZIP_DEFLATED
+        assert infos["logs/session.log"].compress_type == zipfile.ZIP_DEFLATED
+
+    def test_export_missing_session_raises(self):
+        """존재하지 않는 세션 내보내기 시 예외 발생 및 빈 zip 미생성 테스트"""
+        export_path = str(Path(self.temp_dir) / "export")
+        
+        with pytest.raises(FileNotFoundError):
+            self.session_manager.export_session("missing-session", export_path)
+        assert not Path(f"{export_path}.zip").exists()
+
+    def test_list_sessions_skips_non_session_entries(self):
+        """세션 목록 조회 시 메타데이터 없는 항목 제외 테스트"""
+        session_id = self.session_manager.create_session("Test Subject")
+        (Path(self.temp_dir) / "not-a-session").mkdir()
+        (Path(self.temp_dir) / "export.zip").write_bytes(b"")
+        
+        assert self.session_manager.list_sessions() == [session_id]
+
     def test_session_metadata_creation(self):
         """세션 메타데이터 생성 테스트"""
         session_id = self.session_manager.create_session("Test Subject", language="Korean")